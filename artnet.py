@@ -62,6 +62,11 @@ class ArtNetManager:
         # Buffer DMX pour l'envoi et la réception
         self.dmx_send_buffer = bytearray([0] * 512)
         self.dmx_receive_buffer = bytearray([0] * 512)
+        # Protège dmx_send_buffer et active_effects (Tk, audio, séquences et thread DMX)
+        self.dmx_lock = threading.RLock()
+        self._build_rgbw_index()
+        self._build_band_index()
+        self._build_scene_index()
         
         # Timer pour les effets
         self.active_effects = {}
@@ -137,8 +142,7 @@ class ArtNetManager:
                 return
                 
             # Obtenir les fixtures de cette bande
-            band_fixtures = [f for f in self.fixtures_config['fixtures']
-                           if f.get('band') == band]
+            band_fixtures = self.fixtures_for_band(band)
             
             if not band_fixtures:
                 print(f"No fixtures found for band {band}")
@@ -300,34 +304,81 @@ class ArtNetManager:
         except Exception as e:
             print(f"Error sending Art-Net: {e}")
 
-    def get_fixture_values(self):
-        """Retourne les valeurs actuelles des fixtures basées sur la réception Art-Net"""
-        fixture_values = {}
-        
+    def _build_scene_index(self):
+        """Indexe les scènes par nom (la première définition d'un nom l'emporte)"""
+        self._scenes_by_name = {}
+        for scene in self.scenes_config['scenes']:
+            self._scenes_by_name.setdefault(scene['name'], scene)
+
+    def _build_band_index(self):
+        """Indexe les fixtures par nom, par bande et par réponse aux kicks (une seule passe sur la configuration)"""
+        self._fixtures_by_name = {}
+        self._fixtures_by_band = {}
+        self._fixtures_by_kick = {True: [], False: []}
         for fixture in self.fixtures_config['fixtures']:
-            # Calculer l'adresse absolue de la fixture
-            start_channel = fixture['startChannel'] - 1  # Conversion en index 0-based
-            channels = fixture['channels']
-            
-            # Lire les valeurs depuis le buffer de réception
+            self._fixtures_by_name.setdefault(fixture.get('name'), fixture)
+            self._fixtures_by_band.setdefault(fixture.get('band'), []).append(fixture)
+            self._fixtures_by_kick[bool(fixture.get('responds_to_kicks', False))].append(fixture)
+
+    def invalidate_fixture_index(self):
+        """Reconstruit les index de fixtures ; à appeler après toute modification de fixtures_config"""
+        self._build_rgbw_index()
+        self._build_band_index()
+
+    def fixture_by_name(self, name):
+        """Retourne la fixture portant ce nom (la première définie), ou None"""
+        return self._fixtures_by_name.get(name)
+
+    def fixtures_for_band(self, band):
+        """Retourne les fixtures d'une bande (liste partagée, ne pas modifier)"""
+        return self._fixtures_by_band.get(band, [])
+
+    def _build_rgbw_index(self):
+        """Précalcule les adresses DMX (R, G, B, W) de chaque fixture pour une lecture vectorisée"""
+        fixtures = self.fixtures_config['fixtures']
+        self._rgbw_names = [f['name'] for f in fixtures]
+        # Nom -> ligne du tableau RGBW (la première fixture d'un nom l'emporte, comme fixture_by_name)
+        self._rgbw_rows = {}
+        for i, name in enumerate(self._rgbw_names):
+            self._rgbw_rows.setdefault(name, i)
+
+        index = np.full((len(fixtures), 4), -1, dtype=np.intp)
+        for i, fixture in enumerate(fixtures):
             try:
-                values = {
-                    'red': int(self.dmx_receive_buffer[start_channel + channels['red'] - 1]),
-                    'green': int(self.dmx_receive_buffer[start_channel + channels['green'] - 1]),
-                    'blue': int(self.dmx_receive_buffer[start_channel + channels['blue'] - 1]),
-                    'white': int(self.dmx_receive_buffer[start_channel + channels['white'] - 1])
-                }
-            except IndexError:
-                # Si les canaux sont en dehors du buffer, valeurs par défaut
-                values = {'red': 0, 'green': 0, 'blue': 0, 'white': 0}
-                
-            fixture_values[fixture['name']] = values
-            
-        return fixture_values
+                start_channel = fixture['startChannel'] - 1  # Conversion en index 0-based
+                channels = fixture['channels']
+                index[i] = [start_channel + channels[c] - 1 for c in ('red', 'green', 'blue', 'white')]
+            except (KeyError, TypeError, ValueError):
+                # Canal absent ou mal formé : la ligne reste à -1, donc invalide
+                print(f"Warning: fixture '{fixture.get('name', '?')}' has no complete RGBW mapping")
+
+        # Les fixtures sans mapping complet ou dont un canal sort du buffer restent à zéro
+        self._rgbw_valid = ((index >= 0) & (index < 512)).all(axis=1)
+        self._rgbw_index = index[self._rgbw_valid]
+
+    def get_fixture_rgbw(self):
+        """Retourne (noms, tableau uint8 Nx4 R/G/B/W) lus depuis le buffer de réception"""
+        # Snapshot du buffer (le thread de réception peut l'écrire en parallèle)
+        dmx = np.frombuffer(bytes(self.dmx_receive_buffer), dtype=np.uint8)
+        rgbw = np.zeros((len(self._rgbw_names), 4), dtype=np.uint8)
+        rgbw[self._rgbw_valid] = dmx[self._rgbw_index]
+        return self._rgbw_names, rgbw
+
+    def fixture_rgbw_row(self, name):
+        """Ligne d'une fixture dans le tableau retourné par get_fixture_rgbw (None si inconnue)"""
+        return self._rgbw_rows.get(name)
+
+    def get_fixture_values(self):
+        """Retourne les valeurs actuelles des fixtures basées sur la réception Art-Net"""
+        names, rgbw = self.get_fixture_rgbw()
+        return {
+            name: {'red': r, 'green': g, 'blue': b, 'white': w}
+            for name, (r, g, b, w) in zip(names, rgbw.tolist())
+        }
 
     def apply_scene(self, scene_name, fixtures):
         """Applique une scène aux fixtures spécifiées"""
-        scene = next((s for s in self.scenes_config['scenes'] if s['name'] == scene_name), None)
+        scene = self._scenes_by_name.get(scene_name)
         if not scene:
             print(f"Scene '{scene_name}' not found")
             return
@@ -342,37 +393,39 @@ class ArtNetManager:
             'w': 'white'
         }
             
-        # Pour chaque fixture spécifiée
-        for fixture in fixtures:
-            start_channel = fixture['startChannel'] - 1  # Index 0-based, SANS offset +2
-            print(f"Processing fixture '{fixture['name']}' starting at channel {start_channel+1}")
+        # active_effects et dmx_send_buffer sont partagés avec le thread DMX
+        with self.dmx_lock:
+            # Pour chaque fixture spécifiée
+            for fixture in fixtures:
+                start_channel = fixture['startChannel'] - 1  # Index 0-based, SANS offset +2
+                print(f"Processing fixture '{fixture['name']}' starting at channel {start_channel+1}")
             
-            if scene['type'] == 'flash':
-                # Enregistre l'effet avec son temps de decay
-                self.active_effects[fixture['name']] = {
-                    'type': 'flash',
-                    'start_time': time.time(),
-                    'decay': scene['decay'],
-                    'channels': scene['channels'],
-                    'fixture': fixture
-                }
+                if scene['type'] == 'flash':
+                    # Enregistre l'effet avec son temps de decay
+                    self.active_effects[fixture['name']] = {
+                        'type': 'flash',
+                        'start_time': time.time(),
+                        'decay': scene['decay'],
+                        'channels': scene['channels'],
+                        'fixture': fixture
+                    }
                 
-                # Applique les valeurs initiales
-                for short_name, value in scene['channels'].items():
-                    channel_offset = fixture['channels'][color_map[short_name]] - 1
-                    absolute_channel = start_channel + channel_offset
+                    # Applique les valeurs initiales
+                    for short_name, value in scene['channels'].items():
+                        channel_offset = fixture['channels'][color_map[short_name]] - 1
+                        absolute_channel = start_channel + channel_offset
                     
-                    if 0 <= absolute_channel < 512:
-                        self.dmx_send_buffer[absolute_channel] = value
-                        print(f"  Setting channel {absolute_channel+1} ({color_map[short_name]}) to {value}")
-
-        # Debug - afficher les valeurs non nulles
-        non_zero = [(i+1, v) for i, v in enumerate(self.dmx_send_buffer) if v > 0]
-        if non_zero:
-            print(f"Non-zero channels: {non_zero}")
+                        if 0 <= absolute_channel < 512:
+                            self.dmx_send_buffer[absolute_channel] = value
+                            print(f"  Setting channel {absolute_channel+1} ({color_map[short_name]}) to {value}")
+
+            # Debug - afficher les valeurs non nulles
+            non_zero = [(i+1, v) for i, v in enumerate(self.dmx_send_buffer) if v > 0]
+            if non_zero:
+                print(f"Non-zero channels: {non_zero}")
                 
-        # Envoie les données DMX
-        self.send_dmx(self.config.universe, self.dmx_send_buffer)
+            # Envoie les données DMX
+            self.send_dmx(self.config.universe, self.dmx_send_buffer)
 
     def update_effects(self):
         """Met à jour les effets actifs (decay, etc)"""
@@ -387,48 +440,51 @@ class ArtNetManager:
             'w': 'white'
         }
         
-        effects_updated = False
+        # Lecture/écriture des effets et du buffer sous le verrou DMX
+        with self.dmx_lock:
+            effects_updated = False
         
-        for fixture_name, effect in self.active_effects.items():
-            if effect['type'] == 'flash':
-                elapsed = current_time - effect['start_time']
-                start_channel = effect['fixture']['startChannel'] - 1  # SANS offset +2
+            for fixture_name, effect in self.active_effects.items():
+                if effect['type'] == 'flash':
+                    elapsed = current_time - effect['start_time']
+                    start_channel = effect['fixture']['startChannel'] - 1  # SANS offset +2
                 
-                if elapsed >= effect['decay']:
-                    # Effet terminé, éteindre la fixture
-                    for short_name in effect['channels'].keys():
-                        channel_offset = effect['fixture']['channels'][color_map[short_name]] - 1
-                        absolute_channel = start_channel + channel_offset
-                        if 0 <= absolute_channel < 512:
-                            self.dmx_send_buffer[absolute_channel] = 0
-                    to_remove.append(fixture_name)
-                    effects_updated = True
-                else:
-                    # Calcul du fade
-                    ratio = 1.0 - (elapsed / effect['decay'])
-                    for short_name, value in effect['channels'].items():
-                        channel_offset = effect['fixture']['channels'][color_map[short_name]] - 1
-                        absolute_channel = start_channel + channel_offset
-                        if 0 <= absolute_channel < 512:
-                            new_value = int(value * ratio)
-                            self.dmx_send_buffer[absolute_channel] = new_value
-                    effects_updated = True
+                    if elapsed >= effect['decay']:
+                        # Effet terminé, éteindre la fixture
+                        for short_name in effect['channels'].keys():
+                            channel_offset = effect['fixture']['channels'][color_map[short_name]] - 1
+                            absolute_channel = start_channel + channel_offset
+                            if 0 <= absolute_channel < 512:
+                                self.dmx_send_buffer[absolute_channel] = 0
+                        to_remove.append(fixture_name)
+                        effects_updated = True
+                    else:
+                        # Calcul du fade
+                        ratio = 1.0 - (elapsed / effect['decay'])
+                        for short_name, value in effect['channels'].items():
+                            channel_offset = effect['fixture']['channels'][color_map[short_name]] - 1
+                            absolute_channel = start_channel + channel_offset
+                            if 0 <= absolute_channel < 512:
+                                new_value = int(value * ratio)
+                                self.dmx_send_buffer[absolute_channel] = new_value
+                        effects_updated = True
 
-        # Supprime les effets terminés
-        for fixture_name in to_remove:
-            del self.active_effects[fixture_name]
+            # Supprime les effets terminés
+            for fixture_name in to_remove:
+                del self.active_effects[fixture_name]
             
-        # Envoie les mises à jour DMX si nécessaire
-        if effects_updated or to_remove:
-            self.send_dmx(self.config.universe, self.dmx_send_buffer)
+            # Envoie les mises à jour DMX si nécessaire
+            if effects_updated or to_remove:
+                self.send_dmx(self.config.universe, self.dmx_send_buffer)
 
     def get_fixtures_by_criteria(self, band=None, responds_to_kicks=None):
-        """Retourne les fixtures selon des critères spécifiques"""
-        fixtures = self.fixtures_config['fixtures']
-        
-        if band is not None:
-            fixtures = [f for f in fixtures if f.get('band') == band]
-            
+        """Retourne les fixtures selon des critères spécifiques (listes d'index partagées, ne pas modifier)"""
+        if band is None:
+            if responds_to_kicks is None:
+                return self.fixtures_config['fixtures']
+            return self._fixtures_by_kick[bool(responds_to_kicks)]
+
+        fixtures = self.fixtures_for_band(band)
         if responds_to_kicks is not None:
             fixtures = [f for f in fixtures if f.get('responds_to_kicks', False) == responds_to_kicks]
             
@@ -493,7 +549,7 @@ class ArtNetManager:
         scene_name = step['scene']
         
         # Trouver la scène
-        scene = next((s for s in self.scenes_config['scenes'] if s['name'] == scene_name), None)
+        scene = self._scenes_by_name.get(scene_name)
         if not scene:
             print(f"Scene '{scene_name}' not found for sequence step")
             return
@@ -584,28 +640,30 @@ class ArtNetManager:
         # Utiliser la logique existante d'apply_scene mais sans les logs excessifs
         color_map = {'r': 'red', 'g': 'green', 'b': 'blue', 'w': 'white'}
         
-        for fixture in fixtures:
-            start_channel = fixture['startChannel'] - 1
+        # Écritures du buffer sous le verrou DMX (appelé depuis le thread de séquences)
+        with self.dmx_lock:
+            for fixture in fixtures:
+                start_channel = fixture['startChannel'] - 1
             
-            if scene['type'] == 'flash':
-                # Pour les séquences, pas besoin d'effects timer
-                for short_name, value in scene['channels'].items():
-                    channel_offset = fixture['channels'][color_map[short_name]] - 1
-                    absolute_channel = start_channel + channel_offset
+                if scene['type'] == 'flash':
+                    # Pour les séquences, pas besoin d'effects timer
+                    for short_name, value in scene['channels'].items():
+                        channel_offset = fixture['channels'][color_map[short_name]] - 1
+                        absolute_channel = start_channel + channel_offset
                     
-                    if 0 <= absolute_channel < 512:
-                        self.dmx_send_buffer[absolute_channel] = value
-            else:
-                # Scène statique
-                for short_name, value in scene['channels'].items():
-                    channel_offset = fixture['channels'][color_map[short_name]] - 1
-                    absolute_channel = start_channel + channel_offset
+                        if 0 <= absolute_channel < 512:
+                            self.dmx_send_buffer[absolute_channel] = value
+                else:
+                    # Scène statique
+                    for short_name, value in scene['channels'].items():
+                        channel_offset = fixture['channels'][color_map[short_name]] - 1
+                        absolute_channel = start_channel + channel_offset
                     
-                    if 0 <= absolute_channel < 512:
-                        self.dmx_send_buffer[absolute_channel] = value
+                        if 0 <= absolute_channel < 512:
+                            self.dmx_send_buffer[absolute_channel] = value
         
-        # Envoyer les données
-        self.send_dmx(self.config.universe, self.dmx_send_buffer)
+            # Envoyer les données
+            self.send_dmx(self.config.universe, self.dmx_send_buffer)
 
     def set_idle_white(self, intensity=0.05):
         """
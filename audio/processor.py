@@ -28,6 +28,8 @@ class AudioProcessor:
         self.band_analyzer = None
         self.bpm_detector = None  # CORRECTION: Cohérence du nom
         self.audio_filters = None
+        # Renseigné par MainWindow ; None tant qu'aucun ArtNetManager n'est branché
+        self.artnet_manager = None
         
         # Configuration des seuils et états
         self.freq_ranges = {
@@ -262,12 +264,13 @@ class AudioProcessor:
                 self._analyze_band(band, level, threshold, raw_block)
                 self._analyze_sustained_level(band, level, threshold)
 
-            return normalized_levels
+            # Contrat : tableau float32 contigu, une valeur par bande (ordre de freq_ranges)
+            return np.asarray(normalized_levels, dtype=np.float32)
         except Exception as e:
             print(f"Error in compute_levels: {e}")
             import traceback
             traceback.print_exc()
-            return [0, 0, 0, 0]
+            return np.zeros(len(self.freq_ranges), dtype=np.float32)
 
     def _update_auto_thresholds(self, levels):
         """Met à jour automatiquement les seuils basés sur l'historique - VERSION PLUS SENSIBLE"""
@@ -354,7 +357,7 @@ class AudioProcessor:
 
     def _trigger_fade_event(self, band, event_type, intensity):
         """Déclenche les événements de fade"""
-        if hasattr(self, 'artnet_manager') and self.artnet_manager:
+        if self.artnet_manager is not None:
             try:
                 if event_type == 'fade_update':
                     # Mettre à jour l'intensité de la séquence avec le fade
@@ -431,7 +434,7 @@ class AudioProcessor:
 
     def _trigger_sustained_event(self, band, event_type, intensity):
         """Déclenche les événements de niveaux soutenus"""
-        if hasattr(self, 'artnet_manager') and self.artnet_manager:
+        if self.artnet_manager is not None:
             try:
                 current_bpm = self.current_bpm if self.current_bpm > 0 else 120  # BPM par défaut
                 
@@ -502,8 +505,10 @@ class AudioProcessor:
             return None
 
         window_third = self.trend_window // 3
-        first_third = np.mean(list(history['levels'])[:window_third])
-        last_third = np.mean(list(history['levels'])[-window_third:])
+        # Une seule conversion deque -> tableau pour les deux moyennes
+        levels = np.asarray(history['levels'])
+        first_third = levels[:window_third].mean()
+        last_third = levels[-window_third:].mean()
         
         if abs(last_third - first_third) < self.trend_threshold:
             current_state = 'stable'
@@ -525,12 +530,11 @@ class AudioProcessor:
         #if self.debug_kick and band == 'Bass':
             #print(f"[EVENT] {band} -> {event_type}")
             
-        if hasattr(self, 'artnet_manager') and self.artnet_manager:
+        if self.artnet_manager is not None:
             try:
                 if band == 'Bass' and event_type == 'peak':
                     print("[FLASH] Sending kick flash to Art-Net!")
-                    kick_fixtures = [f for f in self.artnet_manager.fixtures_config['fixtures']
-                                   if f.get('responds_to_kicks', False)]
+                    kick_fixtures = self.artnet_manager.get_fixtures_by_criteria(responds_to_kicks=True)
                     if kick_fixtures:
                         import random
                         flash_scenes = ['flash-white', 'flash-red', 'flash-blue']
@@ -554,7 +558,7 @@ class AudioProcessor:
             self.monitor_stream = None
             
         # Arrêter aussi les séquences ArtNet
-        if hasattr(self, 'artnet_manager') and self.artnet_manager:
+        if self.artnet_manager is not None:
             try:
                 if hasattr(self.artnet_manager, 'stop_all_sequences'):
                     self.artnet_manager.stop_all_sequences()
@@ -574,6 +578,18 @@ class AudioProcessor:
             self.auto_thresholds[band]['auto'] = False  # Désactive l'auto
             print(f"Manual threshold set for {band}: {value}")
             
+    def set_thresholds(self, thresholds):
+        """Définit plusieurs seuils manuels en une fois, retourne les seuils appliqués"""
+        applied = {}
+        for band, value in thresholds.items():
+            if band in self.auto_thresholds:
+                self.auto_thresholds[band]['value'] = float(value)
+                self.auto_thresholds[band]['auto'] = False  # Désactive l'auto
+                applied[band] = float(value)
+        if applied:
+            print(f"Manual thresholds set: {applied}")
+        return applied
+
     def enable_auto_threshold(self, band, enable=True):
         """Active/désactive le seuil automatique pour une bande"""
         if band in self.auto_thresholds:
@@ -587,6 +603,10 @@ class AudioProcessor:
         """Retourne le statut de niveau soutenu pour une bande"""
         return self.sustained_detection.get(band, {})
 
+    def set_monitor_volume(self, volume):
+        """Définit le volume du monitoring (0.0 - 1.0)"""
+        self.monitor_volume = max(0.0, min(1.0, float(volume)))
+
     def set_monitor_band(self, band):
         """Change la bande écoutée avec crossfade pour éviter les clicks."""
         if band == self.monitor_band:
@@ -5,6 +5,9 @@ class AppConfig:
     WINDOW_TITLE = "Light Light Show"
     WINDOW_SIZE = "1800x1000"
     UPDATE_INTERVAL = 33  # ms (30 FPS)
+    MIN_REDRAW_INTERVAL = 16  # ms, cadence max des rafraîchissements déclenchés par l'audio
+    DMX_UPDATE_INTERVAL = 25  # ms (40 Hz), cadence du thread des effets DMX
+    FIXTURE_UI_INTERVAL = 66  # ms, rafraîchissement des canvases fixtures (le DMX suit DMX_UPDATE_INTERVAL)
     
     # Paths des fichiers de configuration
     FIXTURES_FILE = "fixtures.json"
@@ -19,6 +22,9 @@ class AppConfig:
         'control_scale_length': 200
     }
     
+    # Bandes de fréquence, dans l'ordre d'affichage
+    BANDS = ('Bass', 'Low-Mid', 'High-Mid', 'Treble')
+
     # Couleurs par bande
     BAND_COLORS = {
         'Bass': 'red',
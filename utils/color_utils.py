@@ -2,6 +2,33 @@ from typing import Tuple
 import colorsys
 import numpy as np
 
+# Numba optionnel pour le mélange RGBW vectorisé (fallback NumPy sinon)
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _blend_rgbw_numpy(rgbw):
+    """Ajoute W à R/G/B avec saturation à 255 (tableau uint8 Nx4 -> Nx3)"""
+    return np.minimum(rgbw[:, :3].astype(np.uint16) + rgbw[:, 3:4], 255).astype(np.uint8)
+
+
+if NUMBA_AVAILABLE:
+    @numba.njit(cache=True)
+    def _blend_rgbw(rgbw):
+        out = np.empty((rgbw.shape[0], 3), dtype=np.uint8)
+        for i in range(rgbw.shape[0]):
+            w = np.uint16(rgbw[i, 3])
+            for c in range(3):
+                v = np.uint16(rgbw[i, c]) + w
+                out[i, c] = 255 if v > 255 else v
+        return out
+else:
+    _blend_rgbw = _blend_rgbw_numpy
+
+
 class ColorUtils:
     """Utilitaires pour la gestion des couleurs"""
     
@@ -24,6 +51,11 @@ class ColorUtils:
         b_blend = min(255, b + w)
         return r_blend, g_blend, b_blend
     
+    @staticmethod
+    def apply_white_blend_array(rgbw: np.ndarray) -> np.ndarray:
+        """Version vectorisée de apply_white_blend pour un tableau uint8 Nx4 (R, G, B, W)"""
+        return _blend_rgbw(np.ascontiguousarray(rgbw, dtype=np.uint8))
+
     @staticmethod
     def scale_color(r: int, g: int, b: int, w: int, intensity: float) -> Tuple[int, int, int, int]:
         """Applique une intensité aux couleurs RGBW"""
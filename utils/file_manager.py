@@ -1,32 +1,49 @@
+import errno
 import json
+import logging
 import os
+import shutil
 from typing import Dict, Any, Optional
 
+logger = logging.getLogger(__name__)
+
 class FileManager:
     """Gestionnaire centralisé des fichiers de configuration"""
-    
+
+    # Dossiers déjà créés/vérifiés (évite un makedirs par sauvegarde)
+    _known_dirs: set = set()
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> 'FileManager':
+        """Retourne l'instance partagée par toute l'application"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     @staticmethod
     def load_json(filepath: str, default: Optional[Dict] = None) -> Dict[str, Any]:
         """Charge un fichier JSON avec gestion d'erreur"""
         try:
             if not os.path.exists(filepath):
                 if default is not None:
-                    print(f"File {filepath} not found, using default")
+                    logger.info("File %s not found, using default", filepath)
                     return default
                 else:
                     raise FileNotFoundError(f"File {filepath} not found and no default provided")
             
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                print(f"✓ Loaded {filepath}")
+                logger.debug("Loaded %s", filepath)
                 return data
         except json.JSONDecodeError as e:
-            print(f"Error parsing JSON in {filepath}: {e}")
+            logger.error("Error parsing JSON in %s: %s", filepath, e)
             if default is not None:
                 return default
             raise
         except Exception as e:
-            print(f"Error loading {filepath}: {e}")
+            logger.error("Error loading %s: %s", filepath, e)
             if default is not None:
                 return default
             raise
@@ -34,31 +51,64 @@ class FileManager:
     @staticmethod
     def save_json(data: Dict[str, Any], filepath: str, indent: int = 2) -> bool:
         """Sauvegarde des données en JSON"""
+        tmp_path = None
         try:
-            # Créer le dossier parent si nécessaire
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            # Créer le dossier parent si nécessaire (une seule fois par dossier)
+            dirname = os.path.dirname(filepath)
+            if dirname and dirname not in FileManager._known_dirs:
+                os.makedirs(dirname, exist_ok=True)
+                FileManager._known_dirs.add(dirname)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
+            # Écriture dans un fichier temporaire puis renommage atomique : le
+            # fichier d'origine (et une éventuelle sauvegarde hardlinkée) n'est
+            # jamais tronqué en place
+            tmp_path = f"{filepath}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=indent, ensure_ascii=False)
-            print(f"✓ Saved {filepath}")
+            os.replace(tmp_path, filepath)
+            logger.debug("Saved %s", filepath)
             return True
         except Exception as e:
-            print(f"Error saving {filepath}: {e}")
+            logger.error("Error saving %s: %s", filepath, e)
+            # Ne pas laisser de .tmp partiel (json.dump interrompu, replace refusé)
+            FileManager._remove_quietly(tmp_path)
             return False
+
+    @staticmethod
+    def _remove_quietly(path: Optional[str]) -> None:
+        """Supprime un fichier temporaire s'il existe, sans lever d'erreur"""
+        if path and os.path.lexists(path):
+            try:
+                os.unlink(path)
+            except OSError as e:
+                logger.error("Error removing %s: %s", path, e)
     
     @staticmethod
     def backup_file(filepath: str) -> bool:
         """Crée une sauvegarde d'un fichier"""
+        tmp_backup = None
         try:
             if os.path.exists(filepath):
                 backup_path = f"{filepath}.backup"
-                import shutil
-                shutil.copy2(filepath, backup_path)
-                print(f"✓ Backup created: {backup_path}")
+                # Lien/copie sous un nom temporaire puis renommage atomique : l'ancienne
+                # sauvegarde reste en place tant que la nouvelle n'est pas complète
+                tmp_backup = f"{backup_path}.tmp"
+                FileManager._remove_quietly(tmp_backup)  # os.link refuse d'écraser
+                try:
+                    # Hardlink : aucune copie de données, save_json remplace
+                    # l'original par renommage donc la sauvegarde reste intacte
+                    os.link(filepath, tmp_backup)
+                except OSError as e:
+                    if e.errno not in (errno.EXDEV, errno.EPERM, errno.ENOTSUP, errno.EMLINK):
+                        raise
+                    shutil.copy2(filepath, tmp_backup)
+                os.replace(tmp_backup, backup_path)
+                logger.debug("Backup created: %s", backup_path)
                 return True
             return False
         except Exception as e:
-            print(f"Error creating backup for {filepath}: {e}")
+            logger.error("Error creating backup for %s: %s", filepath, e)
+            FileManager._remove_quietly(tmp_backup)
             return False
     
     @staticmethod
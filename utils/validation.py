@@ -1,9 +1,21 @@
+from functools import lru_cache
+from itertools import chain
 from typing import Any, Dict, List, Optional, Tuple
 import re
+import numpy as np
 
 class Validator:
     """Validateur pour différents types de données"""
-    
+
+    _instance = None
+
+    @classmethod
+    def instance(cls) -> 'Validator':
+        """Retourne l'instance partagée par toute l'application"""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
     @staticmethod
     def validate_ip_address(ip: str) -> Tuple[bool, str]:
         """Valide une adresse IP"""
@@ -21,7 +33,21 @@ class Validator:
     
     @staticmethod
     def validate_artnet_config(config: Dict[str, Any]) -> Tuple[bool, str]:
-        """Valide une configuration Art-Net"""
+        """Valide une configuration Art-Net (résultat mémorisé pour une même configuration)"""
+        try:
+            items = frozenset(config.items())
+        except TypeError:
+            # Valeurs non hashables : validation directe sans cache
+            return Validator._validate_artnet_config(config)
+        return Validator._validate_artnet_items(items)
+
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _validate_artnet_items(items: frozenset) -> Tuple[bool, str]:
+        return Validator._validate_artnet_config(dict(items))
+
+    @staticmethod
+    def _validate_artnet_config(config: Dict[str, Any]) -> Tuple[bool, str]:
         required_keys = ['ip', 'subnet', 'universe', 'start_channel']
         
         for key in required_keys:
@@ -74,6 +100,62 @@ class Validator:
         
         return True, "Valid fixture configuration"
     
+    @staticmethod
+    def validate_fixture_configs_bulk(fixtures: List[Dict[str, Any]]) -> Tuple[bool, str]:
+        """Valide une liste de fixtures avec des comparaisons vectorisées NumPy"""
+        if not fixtures:
+            return True, "No fixtures to validate"
+
+        # Une seule passe : une clé manquante ou un 'channels' non indexable lève pendant l'extraction
+        names = []
+        rows = []
+        try:
+            for fixture in fixtures:
+                channels = fixture['channels']
+                rows.append((fixture['startChannel'], channels['red'], channels['green'],
+                             channels['blue'], channels['white']))
+                names.append(fixture['name'])
+        except (KeyError, TypeError):
+            return Validator._first_invalid_fixture(fixtures)
+
+        # Entiers stricts uniquement : ni bool, ni float, ni chaîne (aucune conversion silencieuse)
+        if set(map(type, chain.from_iterable(rows))) - {int}:
+            for name, row in zip(names, rows):
+                if any(type(value) is not int for value in row):
+                    return False, f"{name}: channel values must be integers"
+
+        try:
+            values = np.array(rows, dtype=np.int64)
+        except OverflowError:
+            # Entier hors de la plage int64 : forcément hors des plages DMX
+            for name, row in zip(names, rows):
+                if any(abs(value) > 0x7FFFFFFFFFFFFFFF for value in row):
+                    return False, f"Invalid channel configuration for: {name}"
+            return False, "Invalid channel configuration"
+        offsets = values[:, 1:]
+        starts = values[:, 0]
+
+        # Une seule passe pour toutes les fixtures
+        invalid = ((offsets < 1) | (offsets > 4)).any(axis=1) | (starts < 1) | (starts > 512)
+        if invalid.any():
+            bad = [names[i] for i in np.flatnonzero(invalid)]
+            return False, f"Invalid channel configuration for: {', '.join(bad)}"
+
+        return True, f"Valid configuration for {len(fixtures)} fixtures"
+
+    @staticmethod
+    def _first_invalid_fixture(fixtures: List[Dict[str, Any]]) -> Tuple[bool, str]:
+        """Message détaillé de la validation unitaire pour la première fixture invalide"""
+        for fixture in fixtures:
+            name = fixture.get('name', '<unnamed>') if isinstance(fixture, dict) else '<unnamed>'
+            try:
+                is_valid, msg = Validator.validate_fixture_config(fixture)
+            except TypeError as e:
+                is_valid, msg = False, f"Invalid channel values: {e}"
+            if not is_valid:
+                return False, f"{name}: {msg}"
+        return False, "Invalid fixture configuration"
+
     @staticmethod
     def validate_scene_config(scene: Dict[str, Any]) -> Tuple[bool, str]:
         """Valide une configuration de scène"""
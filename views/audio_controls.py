@@ -1,11 +1,17 @@
 import tkinter as tk
 from tkinter import ttk
+from time import monotonic
 import sounddevice as sd
 
 class AudioControlsFrame(ttk.Frame):
+    # Durée de validité de l'énumération PortAudio mise en cache (secondes)
+    DEVICE_CACHE_TTL = 5.0
+
     def __init__(self, parent, callback_manager):
         super().__init__(parent)
         self.callback_manager = callback_manager
+        self._devices_cache = None
+        self._devices_cache_time = 0.0
         self.setup_ui()
 
     def setup_ui(self):
@@ -125,15 +131,24 @@ class AudioControlsFrame(ttk.Frame):
         self.start_button.grid(row=1, column=0, padx=5, pady=5)
 
     def get_audio_inputs(self):
-        devices = sd.query_devices()
+        devices = self.get_audio_devices_full()
         return [dev['name'] for dev in devices if dev['max_input_channels'] > 0]
 
     def get_audio_outputs(self):
-        devices = sd.query_devices()
+        devices = self.get_audio_devices_full()
         return [dev['name'] for dev in devices if dev['max_output_channels'] > 0]
 
     def get_audio_devices_full(self):
-        return sd.query_devices()
+        """Liste des périphériques PortAudio, réénumérée au plus une fois par DEVICE_CACHE_TTL"""
+        now = monotonic()
+        if self._devices_cache is None or now - self._devices_cache_time > self.DEVICE_CACHE_TTL:
+            self._devices_cache = sd.query_devices()
+            self._devices_cache_time = now
+        return self._devices_cache
+
+    def invalidate_device_cache(self):
+        """Force une nouvelle énumération au prochain appel (branchement/débranchement)"""
+        self._devices_cache = None
 
     def get_artnet_config(self):
         return {
@@ -1,12 +1,29 @@
 import tkinter as tk
 from tkinter import ttk
+from collections import defaultdict
+from time import monotonic_ns
+
+from config import AppConfig
+from utils import ColorUtils
 
 class FixtureView(ttk.Frame):
+    # Constantes de disposition (statiques, partagées entre instances)
+    BAND_NAMES = AppConfig.BANDS
+    MAX_ROWS = AppConfig.UI_CONFIG['max_fixtures_per_column']
+    HEADER_COLORS = {'Bass': '#ffcccc', 'Low-Mid': '#ccffcc',
+                     'High-Mid': '#ccccff', 'Treble': '#ffccff'}
+    LEGEND_COLORS = AppConfig.BAND_COLORS
+    # Durée de validité des valeurs lues par update_display (un rafraîchissement des fixtures)
+    VALUES_MAX_AGE_NS = AppConfig.FIXTURE_UI_INTERVAL * 1_000_000
+
     def __init__(self, parent, artnet_manager):
         super().__init__(parent)
         self.artnet_manager = artnet_manager
         self.fixture_canvas = {}
         self.fixture_labels = {}
+        # Dernières valeurs (noms, RGBW) lues pendant update_display (réutilisées pendant un tick UI)
+        self._last_rgbw = ([], None)
+        self._last_values_ns = 0
         self.setup_ui()
 
     def setup_ui(self):
@@ -14,15 +31,13 @@ class FixtureView(ttk.Frame):
         fixture_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
         # Organiser les fixtures par bande avec colonnes multiples
-        band_names = ['Bass', 'Low-Mid', 'High-Mid', 'Treble']
-        max_rows = 3  # Maximum de fixtures par colonne
-        
-        # Grouper les fixtures par bande
-        fixtures_by_band = {band: [] for band in band_names}
+        band_names = self.BAND_NAMES
+        max_rows = self.MAX_ROWS  # Maximum de fixtures par colonne
+
+        # Grouper les fixtures par bande (une seule passe)
+        fixtures_by_band = defaultdict(list)
         for fixture in self.artnet_manager.fixtures_config['fixtures']:
-            band = fixture.get('band', 'Bass')
-            if band in fixtures_by_band:
-                fixtures_by_band[band].append(fixture)
+            fixtures_by_band[fixture.get('band', 'Bass')].append(fixture)
 
         # Headers des bandes
         col_start = 0
@@ -40,10 +55,8 @@ class FixtureView(ttk.Frame):
                             padx=5, pady=5, sticky="ew")
             
             # Couleur de fond pour identifier la bande
-            color_map = {'Bass': '#ffcccc', 'Low-Mid': '#ccffcc', 
-                        'High-Mid': '#ccccff', 'Treble': '#ffccff'}
             try:
-                header_label.configure(background=color_map.get(band, '#f0f0f0'))
+                header_label.configure(background=self.HEADER_COLORS.get(band, '#f0f0f0'))
             except:
                 pass  # Ignore si le style ne supporte pas le background
             
@@ -94,8 +107,7 @@ class FixtureView(ttk.Frame):
         
         # Légende des couleurs
         for i, band in enumerate(band_names):
-            color_map = {'Bass': 'red', 'Low-Mid': 'green', 'High-Mid': 'blue', 'Treble': 'purple'}
-            legend_canvas = tk.Canvas(legend_frame, width=12, height=12, bg=color_map.get(band, 'gray'))
+            legend_canvas = tk.Canvas(legend_frame, width=12, height=12, bg=self.LEGEND_COLORS.get(band, 'gray'))
             legend_canvas.grid(row=0, column=i*2, padx=1)
             ttk.Label(legend_frame, text=band, font=('Arial', 7)).grid(row=0, column=i*2+1, padx=3)
         
@@ -113,64 +125,70 @@ class FixtureView(ttk.Frame):
     def update_display(self):
         """Met à jour l'affichage des fixtures avec les données Art-Net reçues"""
         try:
-            fixture_values = self.artnet_manager.get_fixture_values()
-            
-            for name, values in fixture_values.items():
-                if name in self.fixture_canvas:
-                    # Debug des valeurs reçues pour les fixtures actives
-                    total_brightness = sum(values.values())
-                    #if total_brightness > 10:  # Seuil plus élevé pour réduire le spam
-                        #print(f"[FIXTURE] {name}: R={values['red']} G={values['green']} "
-                        #      f"B={values['blue']} W={values['white']}")
-                    
-                    # Calculer la couleur en tenant compte du blanc
-                    r = values['red']
-                    g = values['green'] 
-                    b = values['blue']
-                    w = values['white']
-                    
-                    # Ajouter le blanc aux autres couleurs pour un rendu plus réaliste
-                    r_display = min(255, r + w)
-                    g_display = min(255, g + w)
-                    b_display = min(255, b + w)
-                    
-                    # Convertir en couleur hex
-                    color = f'#{r_display:02x}{g_display:02x}{b_display:02x}'
-                    
-                    # Mettre à jour le canvas
-                    self.fixture_canvas[name].configure(bg=color)
-                    
-                    # Mettre à jour le label avec les valeurs (format plus compact)
-                    if name in self.fixture_labels:
-                        value_text = f"R:{r:3d} G:{g:3d}\nB:{b:3d} W:{w:3d}"
-                        self.fixture_labels[name].configure(text=value_text)
-                        
+            names, rgbw = self.artnet_manager.get_fixture_rgbw()
+            self._last_rgbw = (names, rgbw)
+            self._last_values_ns = monotonic_ns()
+
+            # Ajouter le blanc aux autres couleurs pour un rendu plus réaliste (vectorisé)
+            blended = ColorUtils.apply_white_blend_array(rgbw).tolist()
+
+            # Références locales pour éviter les lookups répétés dans la boucle
+            canvases = self.fixture_canvas
+            labels = self.fixture_labels
+
+            for name, (r, g, b, w), (r_display, g_display, b_display) in zip(
+                    names, rgbw.tolist(), blended):
+                canvas = canvases.get(name)
+                if canvas is None:
+                    continue
+
+                # Mettre à jour le canvas
+                canvas.configure(bg=f'#{r_display:02x}{g_display:02x}{b_display:02x}')
+
+                # Mettre à jour le label avec les valeurs (format plus compact)
+                label = labels.get(name)
+                if label is not None:
+                    label.configure(text=f"R:{r:3d} G:{g:3d}\nB:{b:3d} W:{w:3d}")
+
         except Exception as e:
             print(f"Error updating fixture display: {e}")
             import traceback
             traceback.print_exc()
 
+    def _fixture_values(self, fixture_name):
+        """Valeurs RGBW d'une seule fixture, depuis le dernier tick UI si elles sont encore fraîches"""
+        row = self.artnet_manager.fixture_rgbw_row(fixture_name)
+        if row is None:
+            return {}
+        if monotonic_ns() - self._last_values_ns > self.VALUES_MAX_AGE_NS:
+            _, rgbw = self.artnet_manager.get_fixture_rgbw()
+        else:
+            rgbw = self._last_rgbw[1]
+        r, g, b, w = rgbw[row].tolist()
+        return {'red': r, 'green': g, 'blue': b, 'white': w}
+
     def get_fixture_info(self, fixture_name):
         """Retourne les informations détaillées d'une fixture"""
-        for fixture in self.artnet_manager.fixtures_config['fixtures']:
-            if fixture['name'] == fixture_name:
-                values = self.artnet_manager.get_fixture_values().get(fixture_name, {})
-                return {
-                    'name': fixture['name'],
-                    'band': fixture.get('band', 'Unknown'),
-                    'start_channel': fixture['startChannel'],
-                    'values': values
-                }
-        return None
+        # Index partagé d'ArtNetManager (reconstruit par invalidate_fixture_index)
+        fixture = self.artnet_manager.fixture_by_name(fixture_name)
+        if fixture is None:
+            return None
+        values = self._fixture_values(fixture_name)
+        return {
+            'name': fixture['name'],
+            'band': fixture.get('band', 'Unknown'),
+            'start_channel': fixture['startChannel'],
+            'values': values
+        }
 
     def highlight_active_fixtures(self, band=None):
         """Surligne visuellement les fixtures actives d'une bande"""
         if not band:
             return
             
-        for fixture in self.artnet_manager.fixtures_config['fixtures']:
-            if fixture.get('band') == band and fixture['name'] in self.fixture_canvas:
-                canvas = self.fixture_canvas[fixture['name']]
+        for fixture in self.artnet_manager.fixtures_for_band(band):
+            canvas = self.fixture_canvas.get(fixture['name'])
+            if canvas is not None:
                 # Ajouter un effet de surbrillance temporaire
                 original_relief = canvas.cget('relief')
                 canvas.configure(relief='raised', borderwidth=3)
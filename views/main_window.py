@@ -1,7 +1,11 @@
 import tkinter as tk
 from tkinter import ttk
-import time
+import threading
 import traceback
+from time import monotonic_ns, sleep
+from contextlib import contextmanager
+from collections import deque
+import numpy as np
 
 # Imports locaux
 from .audio_controls import AudioControlsFrame
@@ -15,6 +19,26 @@ from artnet import ArtNetManager, ArtNetConfig
 # Imports des nouveaux modules utilitaires
 from utils import FileManager, Validator, ColorUtils
 from config import AppConfig
+from config.artnet_config import ArtNetConfig as DefaultArtNetConfig
+
+# Paramètres audio par défaut, résolus une seule fois à l'import
+try:
+    from config import AudioConfig
+    _DEFAULT_GAIN = AudioConfig.DEFAULT_GAIN
+    _DEFAULT_SMOOTHING = AudioConfig.DEFAULT_SMOOTHING
+except ImportError:
+    # Fallback vers les valeurs par défaut
+    _DEFAULT_GAIN, _DEFAULT_SMOOTHING = 0.5, 0.8
+
+BANDS = AppConfig.BANDS
+
+# Univers DMX nul, recopié en place par clear_all_fixtures
+_ZERO_DMX = bytes(512)
+
+def _configure_styles():
+    """Styles ttk communs à toute l'application (une fois la fenêtre Tk créée)"""
+    style = ttk.Style()
+    style.configure("Vertical.TScale", sliderlength=30)
 
 class MainWindow(tk.Tk):
     def __init__(self):
@@ -25,11 +49,68 @@ class MainWindow(tk.Tk):
         self.geometry(AppConfig.WINDOW_SIZE)
 
         # Style général
-        style = ttk.Style()
-        style.configure("Vertical.TScale", sliderlength=30)
+        _configure_styles()
 
         print("✓ Initializing MainWindow...")
 
+        # Composants créés par _create_components (None tant qu'ils n'existent pas)
+        self.audio_controls = None
+        self.artnet_manager = None
+        self.audio_processor = None
+        self.spectrum_view = None
+        self.fixture_view = None
+
+        # État "sale" positionné par le callback audio, vidé par _flush_ui
+        self._dirty = {'bpm': False, 'sustained': False, 'fade': False,
+                       'auto_thresh': False}
+        self._flush_pending = False
+        self._last_bpm = None  # Dernière valeur écrite dans bpm_label
+        self._last_flush_ns = 0
+        self._min_flush_interval_ns = AppConfig.MIN_REDRAW_INTERVAL * 1_000_000
+
+        # Slot unique pour les derniers niveaux audio (le plus récent gagne),
+        # écrit par le thread PortAudio et lu par le thread Tk sous _levels_lock
+        self._levels_lock = threading.Lock()
+        self._latest_levels = np.zeros(len(AppConfig.BANDS), dtype=np.float32)
+        self._levels_seq = 0
+        self._consumed_seq = 0
+
+        # Blocs audio bruts transmis par le callback PortAudio au thread d'analyse
+        # (les plus anciens sont abandonnés si l'analyse prend du retard)
+        self._audio_blocks = deque(maxlen=4)
+        self._audio_ready = threading.Event()
+        # Chaque worker d'analyse a son propre Event d'arrêt : un ancien worker encore
+        # occupé (join expiré) ne peut pas être relancé par le suivant
+        self._dsp_stop = None
+        self._dsp_thread = None
+
+        # Timers after() des appels différés par _debounce (clé -> id)
+        self._debounce_timers = {}
+        # Derniers timers after() programmés par _schedule (clé -> id), annulés par destroy()
+        self._after_ids = {}
+        # Timers after() ponctuels encore en attente (retirés à leur exécution)
+        self._oneshot_after_ids = set()
+
+        # Configuration lue par le worker de chargement, appliquée par update_loop (thread Tk)
+        self._loaded_config = deque(maxlen=1)
+        # Une seule écriture de configuration à la fois (save_json utilise un .tmp fixe)
+        self._save_lock = threading.Lock()
+
+        # Cadences et callbacks des boucles after() (résolus une seule fois)
+        self._tick_interval_ns = AppConfig.UPDATE_INTERVAL * 1_000_000
+        self._next_tick_ns = None  # Échéance du prochain tour de update_loop
+        self._fixture_ui_interval_ns = AppConfig.FIXTURE_UI_INTERVAL * 1_000_000
+        self._dmx_interval_ns = AppConfig.DMX_UPDATE_INTERVAL * 1_000_000
+        self._dmx_running = False
+        self._dmx_thread = None
+        self._last_fixture_ui_ns = 0
+        self._update_loop_bound = self.update_loop
+        self._flush_ui_bound = self._flush_ui
+
+        # Opérations widget différées par batched_updates()
+        self._batch_depth = 0
+        self._pending_widget_ops = []
+
         # Initialisation des gestionnaires centralisés (optionnel pour l'instant)
         self._initialize_managers()
 
@@ -47,9 +128,15 @@ class MainWindow(tk.Tk):
         self._create_components()
         self._setup_test_controls()
 
+        # Fermeture de la fenêtre : arrêter les threads avant de détruire les widgets
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # Démarrer la boucle de mise à jour
-        self.last_update = time.time()
         self.update_loop()
+
+        # Premier affichage des seuils (mode auto) avant tout callback audio
+        self._dirty['auto_thresh'] = True
+        self._schedule_flush()
         
         print("✓ MainWindow initialization complete")
 
@@ -57,8 +144,8 @@ class MainWindow(tk.Tk):
         """Initialise les gestionnaires globaux (version simplifiée pour l'instant)"""
         try:
             # Ces gestionnaires peuvent être ajoutés progressivement
-            self.file_manager = FileManager()
-            self.validator = Validator()
+            self.file_manager = FileManager.instance()
+            self.validator = Validator.instance()
             print("✓ Utility managers initialized")
         except Exception as e:
             print(f"Warning: Could not initialize utility managers: {e}")
@@ -80,18 +167,19 @@ class MainWindow(tk.Tk):
                 print(f"Warning: ArtNet config validation failed: {msg}")
 
         self.artnet_manager = ArtNetManager(artnet_config)
+        if self.validator:
+            valid, msg = self.validator.validate_fixture_configs_bulk(
+                self.artnet_manager.fixtures_config['fixtures'])
+            if not valid:
+                print(f"Warning: Fixture config validation failed: {msg}")
         self.artnet_manager.start()
+        self._start_dmx_thread()
         
         # Créer l'audio processor avec les nouvelles configurations
-        try:
-            from config import AudioConfig
-            self.audio_processor = AudioProcessor(
-                gain=AudioConfig.DEFAULT_GAIN, 
-                smoothing_factor=AudioConfig.DEFAULT_SMOOTHING
-            )
-        except ImportError:
-            # Fallback vers les valeurs par défaut
-            self.audio_processor = AudioProcessor(gain=0.5, smoothing_factor=0.8)
+        self.audio_processor = AudioProcessor(
+            gain=_DEFAULT_GAIN,
+            smoothing_factor=_DEFAULT_SMOOTHING
+        )
         
         print("Setting up artnet_manager in audio_processor...")
         self.audio_processor.artnet_manager = self.artnet_manager
@@ -104,6 +192,60 @@ class MainWindow(tk.Tk):
         self.fixture_view = FixtureView(self.mainframe, self.artnet_manager)
         self.fixture_view.grid(row=2, column=0, sticky="nsew")
 
+        self._bind_hot_paths()
+
+        # Un seul calcul de géométrie une fois tous les widgets placés
+        self._safe_refresh()
+
+    def _start_dmx_thread(self):
+        """Lance la boucle des effets DMX hors du thread Tk"""
+        self._dmx_running = True
+        self._dmx_thread = threading.Thread(target=self._dmx_tick_loop, daemon=True)
+        self._dmx_thread.start()
+        print("✓ DMX effects thread started")
+
+    def _dmx_tick_loop(self):
+        """Met à jour les effets DMX à DMX_UPDATE_INTERVAL, indépendamment de la charge de l'UI"""
+        interval_ns = self._dmx_interval_ns
+        next_tick_ns = monotonic_ns()
+        while self._dmx_running:
+            try:
+                self.artnet_manager.update_effects()
+            except Exception as e:
+                print(f"Error in DMX loop: {e}")
+            next_tick_ns += interval_ns
+            remaining_ns = next_tick_ns - monotonic_ns()
+            if remaining_ns > 0:
+                sleep(remaining_ns / 1e9)
+            else:
+                # En retard : repartir de maintenant plutôt que d'enchaîner les tours
+                next_tick_ns = monotonic_ns()
+
+    def _stop_dmx_thread(self):
+        """Arrête la boucle des effets DMX"""
+        self._dmx_running = False
+        if self._dmx_thread is not None:
+            self._dmx_thread.join(timeout=1.0)
+            self._dmx_thread = None
+
+    def _bind_hot_paths(self):
+        """Résout une fois les références utilisées à chaque flush (à rappeler si un composant est remplacé)"""
+        ap = self.audio_processor
+        self._sustained_detection = ap.sustained_detection
+        self._fade_detection = ap.fade_detection
+        self._auto_thresholds = ap.auto_thresholds
+        self._update_band = self.spectrum_view.update_band
+        self._update_bars = self.spectrum_view.update_bars
+        self._configure_bpm = self.audio_controls.bpm_label.configure
+
+    def _safe_refresh(self):
+        """Traite les tâches idle en attente (géométrie, redessin).
+
+        Toujours passer par update_idletasks() : update() traite aussi les
+        événements utilisateur et peut réentrer dans les callbacks en cours.
+        """
+        self.update_idletasks()
+
     def _setup_test_controls(self):
         """Configure les contrôles de test (désormais en haut à droite, vertical)"""
         # Ancien: row=3, column=0 horizontal
@@ -127,7 +269,7 @@ class MainWindow(tk.Tk):
         ttk.Label(test_frame, text="").pack(pady=2)
 
         # TEST IMMÉDIAT : Envoyer un flash blanc pour tester
-        self.after(2000, self.test_fixture_flash)
+        self._schedule_once(2000, self.test_fixture_flash)
 
     def save_configuration(self):
         """Sauvegarde la configuration actuelle"""
@@ -136,13 +278,13 @@ class MainWindow(tk.Tk):
             return
             
         try:
-            # Sauvegarder l'état actuel
+            # Lire l'état des widgets ici (thread Tk), écrire le fichier dans un thread
             config_data = {
                 'artnet': self.audio_controls.get_artnet_config(),
                 'audio': {
                     'thresholds': {
                         band: self.audio_processor.get_threshold(band) 
-                        for band in ['Bass', 'Low-Mid', 'High-Mid', 'Treble']
+                        for band in BANDS
                     },
                     'monitor_band': getattr(self.audio_processor, 'monitor_band', 'Mix'),
                     'monitor_volume': getattr(self.audio_processor, 'monitor_volume', 0.5)
@@ -151,21 +293,30 @@ class MainWindow(tk.Tk):
                     'window_geometry': self.geometry()
                 }
             }
-            
-            success = self.file_manager.save_json(config_data, 'lightshow_config.json')
-            if success:
-                print("✓ Configuration saved successfully")
-            else:
-                print("✗ Failed to save configuration")
+            threading.Thread(target=self._save_configuration_worker,
+                             args=(config_data,), daemon=True).start()
         except Exception as e:
             print(f"Error saving configuration: {e}")
 
+    def _save_configuration_worker(self, config_data):
+        """Écriture JSON hors du thread Tk (sérialisée : deux clics rapprochés ne se chevauchent pas)"""
+        with self._save_lock:
+            success = self.file_manager.save_json(config_data, 'lightshow_config.json')
+        if success:
+            print("✓ Configuration saved successfully")
+        else:
+            print("✗ Failed to save configuration")
+
     def load_configuration(self):
         """Charge une configuration sauvegardée"""
         if not self.file_manager:
             print("File manager not available")
             return
-            
+
+        threading.Thread(target=self._load_configuration_worker, daemon=True).start()
+
+    def _load_configuration_worker(self):
+        """Lecture JSON hors du thread Tk ; le résultat est déposé pour update_loop"""
         try:
             default_config = {
                 'artnet': {'ip': '192.168.18.28', 'subnet': 0, 'universe': 0, 'start_channel': 1},
@@ -174,15 +325,24 @@ class MainWindow(tk.Tk):
             }
             
             config_data = self.file_manager.load_json('lightshow_config.json', default_config)
-            
-            # Appliquer la configuration chargée
+            # Aucun appel Tk depuis ce thread : update_loop appliquera la configuration
+            self._loaded_config.append(config_data)
+        except Exception as e:
+            print(f"Error loading configuration: {e}")
+
+    def _apply_loaded_config(self, config_data):
+        """Applique une configuration chargée (thread Tk)"""
+        try:
             if 'audio' in config_data:
                 audio_config = config_data['audio']
                 if 'thresholds' in audio_config:
-                    for band, threshold in audio_config['thresholds'].items():
-                        if hasattr(self.audio_processor, 'set_threshold'):
-                            self.audio_processor.set_threshold(band, threshold)
-                            
+                    applied = self.audio_processor.set_thresholds(audio_config['thresholds'])
+                    with self.batched_updates():
+                        for band, threshold in applied.items():
+                            self._queue(self.spectrum_view, 'update_threshold_line', band, threshold)
+                    self._dirty['auto_thresh'] = True
+                    self._schedule_flush()
+
             print("✓ Configuration loaded successfully")
         except Exception as e:
             print(f"Error loading configuration: {e}")
@@ -191,14 +351,13 @@ class MainWindow(tk.Tk):
         """Test les fixtures avec un flash blanc"""
         print("[TEST] Testing fixture flash...")
         try:
-            bass_fixtures = [f for f in self.artnet_manager.fixtures_config['fixtures']
-                           if f.get('band') == 'Bass']
+            bass_fixtures = self.artnet_manager.fixtures_for_band('Bass')
             if bass_fixtures:
                 self.artnet_manager.apply_scene('flash-white', bass_fixtures)
                 print(f"[TEST] Applied flash-white to {len(bass_fixtures)} bass fixtures")
                 
                 # Programmer l'extinction après 2 secondes
-                self.after(2000, lambda: self.clear_all_fixtures())
+                self._schedule_once(2000, self.clear_all_fixtures)
             else:
                 print("[TEST] No bass fixtures found!")
         except Exception as e:
@@ -209,63 +368,137 @@ class MainWindow(tk.Tk):
         """Éteint toutes les fixtures"""
         print("[TEST] Clearing all fixtures...")
         try:
-            # Remettre tous les canaux à zéro
-            self.artnet_manager.dmx_send_buffer = bytearray([0] * 512)
-            self.artnet_manager.send_dmx(self.artnet_manager.config.universe, 
-                                       self.artnet_manager.dmx_send_buffer)
+            # Remettre tous les canaux à zéro (copie en place, sans allocation)
+            with self.artnet_manager.dmx_lock:
+                buffer = self.artnet_manager.dmx_send_buffer
+                buffer[:] = _ZERO_DMX
+                self.artnet_manager.send_dmx(self.artnet_manager.config.universe, buffer)
             print("✓ All fixtures cleared")
         except Exception as e:
             print(f"[TEST] Error clearing fixtures: {e}")
 
+    @contextmanager
+    def batched_updates(self):
+        """Regroupe les opérations widget et les applique en une rafale à la sortie (réentrant)"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                ops, self._pending_widget_ops = self._pending_widget_ops, []
+                for fn, args, kwargs in ops:
+                    fn(*args, **kwargs)
+
+    def _queue(self, target, method_name, *args, **kwargs):
+        """Appelle target.method_name(...) maintenant, ou à la fin du batch en cours"""
+        self._queue_call(getattr(target, method_name), *args, **kwargs)
+
+    def _queue_call(self, fn, *args, **kwargs):
+        """Comme _queue, pour une méthode déjà liée"""
+        if self._batch_depth:
+            self._pending_widget_ops.append((fn, args, kwargs))
+        else:
+            fn(*args, **kwargs)
+
     def update_loop(self):
-        """Boucle principale de mise à jour avec gestion d'erreur améliorée"""
+        """Boucle UI à cadence fixe (les effets DMX tournent dans _dmx_tick_loop)"""
         try:
-            current_time = time.time()
-            
-            # Mise à jour des effets DMX
-            if hasattr(self, 'artnet_manager') and self.artnet_manager:
-                self.artnet_manager.update_effects()
-            
-            # Mise à jour des affichages
-            if hasattr(self, 'fixture_view') and self.fixture_view:
-                self.fixture_view.update_display()
-            
-            # Mise à jour des statuts sustained
-            if (hasattr(self, 'audio_processor') and 
-                hasattr(self.audio_processor, 'sustained_detection') and
-                hasattr(self, 'spectrum_view')):
-                for band, status in self.audio_processor.sustained_detection.items():
-                    self.spectrum_view.update_sustained_status(band, status)
-            
-            # Mise à jour des statuts de fade
-            if (hasattr(self, 'audio_processor') and 
-                hasattr(self.audio_processor, 'fade_detection') and
-                hasattr(self, 'spectrum_view')):
-                for band, fade_info in self.audio_processor.fade_detection.items():
-                    self.spectrum_view.update_fade_status(band, fade_info)
-            
-            # Mise à jour des seuils automatiques dans l'affichage
-            if (hasattr(self, 'audio_processor') and 
-                hasattr(self.audio_processor, 'auto_thresholds') and
-                hasattr(self, 'spectrum_view')):
-                for band, thresh_info in self.audio_processor.auto_thresholds.items():
-                    self.spectrum_view.update_auto_threshold_display(
-                        band, thresh_info['value'], thresh_info['auto'])
-            
-            # Mise à jour du BPM
-            if (hasattr(self, 'audio_processor') and 
-                hasattr(self.audio_processor, 'current_bpm') and
-                hasattr(self, 'audio_controls')):
-                self.audio_controls.bpm_label.configure(
-                    text=f"BPM: {self.audio_processor.current_bpm}")
-                    
+            with self.batched_updates():
+                # Mise à jour des affichages, limitée à FIXTURE_UI_INTERVAL
+                fixture_view = self.fixture_view
+                now_ns = monotonic_ns()
+                if (fixture_view is not None
+                        and now_ns - self._last_fixture_ui_ns >= self._fixture_ui_interval_ns):
+                    self._last_fixture_ui_ns = now_ns
+                    fixture_view.update_display()
+
+            # Configuration chargée par le worker : l'appliquer depuis le thread Tk
+            if self._loaded_config:
+                self._apply_loaded_config(self._loaded_config.pop())
+
+            # Nouveaux niveaux publiés par le thread audio : rafraîchir l'UI depuis le thread Tk
+            if self._levels_seq != self._consumed_seq:
+                self._schedule_flush()
+
         except Exception as e:
             print(f"Error in update loop: {e}")
             # Ne pas imprimer le traceback complet à chaque fois pour éviter le spam
             # traceback.print_exc()
         
-        # Programmer la prochaine mise à jour
-        self.after(AppConfig.UPDATE_INTERVAL, self.update_loop)
+        # Programmer la prochaine mise à jour sur une échéance fixe (compense la durée du tour)
+        now_ns = monotonic_ns()
+        interval_ns = self._tick_interval_ns
+        next_tick_ns = self._next_tick_ns
+        if next_tick_ns is None or now_ns - next_tick_ns > interval_ns:
+            # Premier tour ou retard de plus d'un intervalle : on saute les tours perdus
+            next_tick_ns = now_ns + interval_ns
+        else:
+            next_tick_ns += interval_ns
+        self._next_tick_ns = next_tick_ns
+        self._schedule('update_loop', max(1, (next_tick_ns - now_ns) // 1_000_000),
+                       self._update_loop_bound)
+
+    def _schedule_flush(self):
+        """Programme un seul rafraîchissement de l'UI pour tous les changements en attente"""
+        if not self._flush_pending:
+            self._flush_pending = True
+            self._after_ids['flush'] = self.after_idle(self._flush_ui_bound)
+
+    def _flush_ui(self):
+        """Applique les changements marqués dans self._dirty en un seul passage"""
+        # Limiter la cadence : si on arrive trop tôt, se reprogrammer pour la fin de l'intervalle
+        now_ns = monotonic_ns()
+        remaining_ns = self._min_flush_interval_ns - (now_ns - self._last_flush_ns)
+        if remaining_ns > 0:
+            self._schedule('flush', max(1, remaining_ns // 1_000_000), self._flush_ui_bound)
+            return
+        self._last_flush_ns = now_ns
+        self._flush_pending = False
+
+        # Références résolues une fois par flush (accès locaux dans le corps)
+        dirty = self._dirty
+        queue_call = self._queue_call
+        try:
+            with self.batched_updates():
+                # Niveaux et drapeaux relevés puis remis à zéro sous le verrou du thread d'analyse
+                levels = None
+                with self._levels_lock:
+                    levels_seq = self._levels_seq
+                    if levels_seq != self._consumed_seq:
+                        self._consumed_seq = levels_seq
+                        levels = self._latest_levels.copy()
+                    sustained_dirty, fade_dirty = dirty['sustained'], dirty['fade']
+                    auto_dirty, bpm_dirty = dirty['auto_thresh'], dirty['bpm']
+                    dirty['sustained'] = dirty['fade'] = dirty['auto_thresh'] = dirty['bpm'] = False
+                if levels is not None:
+                    queue_call(self._update_bars, levels)
+
+                # Statuts sustained / fade / seuils auto : une seule passe par bande
+                sustained = self._sustained_detection if sustained_dirty else None
+                fade = self._fade_detection if fade_dirty else None
+                auto = self._auto_thresholds if auto_dirty else None
+
+                if sustained is not None or fade is not None or auto is not None:
+                    update_band = self._update_band
+                    for band in BANDS:
+                        thresh_info = auto.get(band) if auto is not None else None
+                        queue_call(
+                            update_band, band,
+                            sustained.get(band) if sustained is not None else None,
+                            fade.get(band) if fade is not None else None,
+                            thresh_info['value'] if thresh_info else None,
+                            thresh_info['auto'] if thresh_info else None)
+
+                # Mise à jour du BPM
+                if bpm_dirty:
+                    bpm = self.audio_processor.current_bpm
+                    if bpm != self._last_bpm:
+                        self._last_bpm = bpm
+                        queue_call(self._configure_bpm, text=f"BPM: {bpm}")
+
+        except Exception as e:
+            print(f"Error flushing UI updates: {e}")
 
     def get_artnet_config(self):
         """Récupère la configuration ArtNet avec validation"""
@@ -283,8 +516,7 @@ class MainWindow(tk.Tk):
         except Exception as e:
             print(f"Error getting ArtNet config: {e}")
             # Retourner une configuration par défaut
-            from config import ArtNetConfig
-            return ArtNetConfig.default()
+            return DefaultArtNetConfig.default()
 
     # Callbacks pour les sous-composants (méthodes maintenues)
     def toggle_recording(self):
@@ -303,33 +535,27 @@ class MainWindow(tk.Tk):
         """Callback quand un seuil est changé manuellement"""
         self.audio_processor.set_threshold(band, value)
         self.spectrum_view.update_threshold_line(band, value)
+        self._dirty['auto_thresh'] = True
+        self._schedule_flush()
 
     def on_auto_threshold_change(self, band, enabled):
         """Callback pour activer/désactiver les seuils auto"""
-        if hasattr(self.audio_processor, 'enable_auto_threshold'):
-            self.audio_processor.enable_auto_threshold(band, enabled)
-            print(f"Auto threshold {'enabled' if enabled else 'disabled'} for {band}")
-
-    def _update_display(self, levels):
-        """Met à jour à la fois les barres et le BPM"""
-        if hasattr(self, 'spectrum_view'):
-            self.spectrum_view.update_bars(levels)
-        if (hasattr(self, 'audio_processor') and 
-            hasattr(self.audio_processor, 'current_bpm') and
-            hasattr(self, 'audio_controls')):
-            self.audio_controls.bpm_label.configure(
-                text=f"BPM: {self.audio_processor.current_bpm}")
+        self.audio_processor.enable_auto_threshold(band, enabled)
+        print(f"Auto threshold {'enabled' if enabled else 'disabled'} for {band}")
+        self._dirty['auto_thresh'] = True
+        self._schedule_flush()
 
     def start_recording(self):
         if self.audio_processor.stream is not None:
             self.stop_recording()
         device_name = self.audio_controls.audio_combo.get()
+        # Une seule énumération PortAudio, indexée par nom pour les deux recherches
         device_list = self.audio_controls.get_audio_devices_full()
-        device_idx = None
+        device_index = {}
         for idx, device in enumerate(device_list):
-            if device['name'] == device_name:
-                device_idx = idx
-                break
+            device_index.setdefault(device['name'], idx)
+
+        device_idx = device_index.get(device_name)
         if device_idx is None:
             print(f"Device not found: {device_name}")
             return
@@ -339,18 +565,15 @@ class MainWindow(tk.Tk):
         print(f"Selected device: {device_name} | Channels: {channels} | Sample rate: {samplerate}")
 
         # Get monitoring device if selected
-        monitor_device = None
         monitor_name = self.audio_controls.monitor_combo.get()
-        if monitor_name:
-            device_list = self.audio_controls.get_audio_devices_full()
-            for idx, device in enumerate(device_list):
-                if device['name'] == monitor_name:
-                    monitor_device = idx
-                    break
+        monitor_device = device_index.get(monitor_name) if monitor_name else None
         
         # Get monitor volume
         monitor_volume = self.audio_controls.volume_scale.get() / 100.0
 
+        audio_blocks = self._audio_blocks
+        audio_ready = self._audio_ready
+
         def audio_callback(indata, frames, time, status):
             try:
                 if status and status.input_overflow:
@@ -358,46 +581,158 @@ class MainWindow(tk.Tk):
                     return
                     
                 if self.audio_processor.is_recording:
-                    audio_data = indata[:, 0]
-                    levels = self.audio_processor.compute_levels(audio_data)
-                    # Mettre à jour à la fois les barres et le BPM
-                    self.after(0, lambda: self._update_display(levels))
+                    # Thread temps réel : copier le bloc et rendre la main, l'analyse se fait dans _dsp_loop
+                    audio_blocks.append(indata[:, 0].copy())
+                    audio_ready.set()
             except Exception as e:
                 print(f"Error in audio callback: {e}")
                 traceback.print_exc()
 
-        self.audio_processor.start(
-            device_idx=device_idx,
-            samplerate=samplerate,
-            channels=channels,
-            callback=audio_callback,
-            monitor_device=monitor_device,
-            monitor_volume=monitor_volume
-        )
+        self._start_dsp_thread()
+        try:
+            self.audio_processor.start(
+                device_idx=device_idx,
+                samplerate=samplerate,
+                channels=channels,
+                callback=audio_callback,
+                monitor_device=monitor_device,
+                monitor_volume=monitor_volume
+            )
+        except Exception:
+            # Flux non ouvert : ne pas laisser le worker d'analyse tourner à vide
+            self._stop_dsp_thread()
+            raise
         
         # Enable monitoring if device selected
         self.audio_processor.enable_monitoring(monitor_device is not None)
 
     def stop_recording(self):
+        # Arrêter l'analyse d'abord : aucun bloc en attente ne doit relancer une séquence
+        # ou un flash après l'extinction faite par audio_processor.stop()
+        self._stop_dsp_thread()
         self.audio_processor.stop()
 
+    def _start_dsp_thread(self):
+        """Lance le thread d'analyse des blocs audio (s'il ne tourne pas déjà)"""
+        if (self._dsp_thread is not None and self._dsp_thread.is_alive()
+                and not self._dsp_stop.is_set()):
+            return
+        self._audio_blocks.clear()
+        self._dsp_stop = threading.Event()
+        self._dsp_thread = threading.Thread(target=self._dsp_loop, args=(self._dsp_stop,),
+                                            daemon=True)
+        self._dsp_thread.start()
+
+    def _stop_dsp_thread(self):
+        """Arrête le thread d'analyse et abandonne les blocs en attente"""
+        if self._dsp_stop is not None:
+            self._dsp_stop.set()
+        self._audio_ready.set()
+        if self._dsp_thread is not None:
+            self._dsp_thread.join(timeout=1.0)
+            if self._dsp_thread.is_alive():
+                # Encore dans compute_levels : son Event reste posé, il s'arrêtera après ce bloc
+                print("Warning: audio analysis thread did not stop within 1s")
+            self._dsp_thread = None
+            self._dsp_stop = None
+        self._audio_blocks.clear()
+
+    def _dsp_loop(self, stop):
+        """Consomme les blocs audio jusqu'à stop : compute_levels puis publication des niveaux pour l'UI"""
+        blocks = self._audio_blocks
+        ready = self._audio_ready
+        compute_levels = self.audio_processor.compute_levels
+        dirty = self._dirty
+        while not stop.is_set():
+            ready.wait(0.1)
+            ready.clear()
+            while blocks and not stop.is_set():
+                try:
+                    # float32, une valeur par bande (voir AudioProcessor.compute_levels)
+                    levels = compute_levels(blocks.popleft())
+                    # Écrire dans le slot et marquer l'état modifié ; aucun appel Tk depuis ce thread,
+                    # update_loop se charge de programmer le rafraîchissement
+                    # Niveaux, séquence et drapeaux publiés ensemble : _flush_ui les relève sous le même verrou
+                    with self._levels_lock:
+                        np.copyto(self._latest_levels, levels)
+                        self._levels_seq += 1
+                        dirty['bpm'] = dirty['sustained'] = dirty['fade'] = dirty['auto_thresh'] = True
+                except Exception as e:
+                    print(f"Error in audio analysis: {e}")
+
+    def _schedule(self, key, delay_ms, callback, *args):
+        """self.after() dont l'id est conservé sous key pour être annulé à la fermeture"""
+        self._after_ids[key] = self.after(delay_ms, callback, *args)
+
+    def _schedule_once(self, delay_ms, callback, *args):
+        """self.after() ponctuel, suivi jusqu'à son exécution pour être annulé à la fermeture"""
+        timer = None
+
+        def run():
+            self._oneshot_after_ids.discard(timer)
+            callback(*args)
+
+        timer = self.after(delay_ms, run)
+        self._oneshot_after_ids.add(timer)
+
+    def on_close(self):
+        """WM_DELETE_WINDOW : arrête l'audio, le thread DMX et Art-Net puis détruit la fenêtre"""
+        try:
+            if self.audio_processor is not None and self.audio_processor.is_recording:
+                self.stop_recording()
+            self._stop_dsp_thread()
+            self._stop_dmx_thread()
+            if self.artnet_manager is not None:
+                self.artnet_manager.stop()
+        except Exception as e:
+            print(f"Error during shutdown: {e}")
+        self.destroy()
+
+    def destroy(self):
+        """Annule les timers after() en attente avant de détruire la fenêtre"""
+        timers = (list(self._after_ids.values()) + list(self._oneshot_after_ids)
+                  + list(self._debounce_timers.values()))
+        for timer in timers:
+            try:
+                self.after_cancel(timer)
+            except Exception:
+                pass
+        self._after_ids.clear()
+        self._oneshot_after_ids.clear()
+        self._debounce_timers.clear()
+        super().destroy()
+
+    def _debounce(self, key, delay_ms, fn, *args):
+        """Reporte fn(*args) de delay_ms ; un nouvel appel avec la même clé remplace le précédent"""
+        timer = self._debounce_timers.get(key)
+        if timer is not None:
+            self.after_cancel(timer)
+        self._debounce_timers[key] = self.after(delay_ms, self._run_debounced, key, fn, args)
+
+    def _run_debounced(self, key, fn, args):
+        self._debounce_timers.pop(key, None)
+        fn(*args)
+
     def on_monitor_volume_change(self, value):
-        if hasattr(self, 'audio_processor'):
-            self.audio_processor.set_monitor_volume(float(value) / 100.0)
+        # Le Scale appelle ce callback à chaque pixel : n'appliquer que la valeur finale
+        self._debounce('monitor_volume', 50, self._apply_monitor_volume, float(value) / 100.0)
+
+    def _apply_monitor_volume(self, volume):
+        if self.audio_processor is not None:
+            self.audio_processor.set_monitor_volume(volume)
 
     def on_monitor_band_change(self, band):
         """Appelé quand l'utilisateur change la bande à monitorer"""
-        if hasattr(self, 'audio_processor'):
+        if self.audio_processor is not None:
             self.audio_processor.set_monitor_band(band)
 
     def test_red_flash(self):
         """Test avec un flash rouge"""
         try:
-            bass_fixtures = [f for f in self.artnet_manager.fixtures_config['fixtures']
-                           if f.get('band') == 'Bass']
+            bass_fixtures = self.artnet_manager.fixtures_for_band('Bass')
             self.artnet_manager.apply_scene('flash-red', bass_fixtures)
             print("[TEST] Applied flash-red to bass fixtures")
             # Auto clear après 1 seconde
-            self.after(1000, self.clear_all_fixtures)
+            self._schedule_once(1000, self.clear_all_fixtures)
         except Exception as e:
             print(f"Error testing red flash: {e}")
\ No newline at end of file
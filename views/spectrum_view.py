@@ -1,12 +1,28 @@
+"""Vue spectre : barres par bande, lignes de seuil et contrôles associés.
+
+Aucun dessin synchrone depuis le thread audio : les mises à jour arrivent par le
+flush de MainWindow (thread Tk) et se limitent à des coords() sur le canvas,
+jamais à update().
+"""
 import tkinter as tk
 from tkinter import ttk
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import weakref
+import numpy as np
+
+from config import AppConfig
+
+# Position de chaque bande dans les barres / lignes de seuil
+BAND_INDEX = {band: i for i, band in enumerate(AppConfig.BANDS)}
 
 class SpectrumView(ttk.Frame):
     def __init__(self, parent, callback_manager):
         super().__init__(parent)
         self.callback_manager = callback_manager
+        # Dernier état écrit par widget / bande : évite les configure() et set() inutiles
+        self._label_state = {}
+        self._threshold_shown = {}
+        # Dernier palier (pas de 0.05) transmis par chaque scale
+        self._last_bucket = {}
         self.setup_ui()
 
     def setup_ui(self):
@@ -20,33 +36,71 @@ class SpectrumView(ttk.Frame):
         graph_frame = ttk.Frame(parent)
         graph_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-        self.fig = Figure(figsize=(3, 3))  # Réduit de 8 à 2.7 (environ un tiers)
-        self.ax = self.fig.add_subplot(111)
-        self.canvas = FigureCanvasTkAgg(self.fig, master=graph_frame)
-        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        # Canvas Tk natif : 4 rectangles et 4 lignes déplacés par coords(), sans rastérisation
+        self.canvas = tk.Canvas(graph_frame, width=300, height=300, bg='white',
+                                highlightthickness=0)
+        self.canvas.pack(fill=tk.BOTH, expand=True)
 
         self.band_colors = ['red', 'green', 'blue', 'purple']
         # Mettre à jour les labels pour correspondre aux nouvelles plages
         self.band_names = ['Bass\n20-150Hz', 'Low-Mid\n150-500Hz', 
                           'High-Mid\n500-2.5kHz', 'Treble\n2.5-20kHz']
 
-        self.bars = self.ax.bar(
-            self.band_names,
-            [0, 0, 0, 0],
-            color=self.band_colors
-        )
+        # Dernières valeurs affichées, réappliquées après un redimensionnement
+        self._levels = [0.0] * len(self.band_names)
+        self._thresholds = [0.5] * len(self.band_names)
 
-        self.threshold_lines = []
-        for i in range(4):
-            line = self.ax.axhline(
-                y=0.5, 
-                color=self.band_colors[i],
-                linestyle='--', 
-                alpha=0.5
-            )
-            self.threshold_lines.append(line)
+        canvas = self.canvas
+        self._axis = canvas.create_line(0, 0, 0, 0, fill='black')
+        self.bars = [canvas.create_rectangle(0, 0, 0, 0, fill=color, outline='')
+                     for color in self.band_colors]
+        self.threshold_lines = [canvas.create_line(0, 0, 0, 0, fill=color, dash=(4, 2))
+                                for color in self.band_colors]
+        self._band_texts = [canvas.create_text(0, 0, text=name, anchor=tk.N, font=('Arial', 7))
+                            for name in self.band_names]
+
+        self._layout(300, 300)
+        canvas.bind('<Configure>', self._on_resize)
+
+    def _on_resize(self, event):
+        self._layout(event.width, event.height)
+
+    def _layout(self, width, height):
+        """Recalcule la géométrie (zone de tracé, colonnes des barres) et replace tous les items"""
+        margin, label_height = 5, 28
+        self._left, self._right = margin, max(margin + 1, width - margin)
+        self._top = margin
+        self._bottom = max(self._top + 1, height - label_height)
+        self._plot_height = self._bottom - self._top
+
+        slot = (self._right - self._left) / len(self.bars)
+        bar_width = slot * 0.8
+        self._bar_x = []
+        canvas = self.canvas
+        for i, text in enumerate(self._band_texts):
+            center = self._left + slot * (i + 0.5)
+            self._bar_x.append((center - bar_width / 2, center + bar_width / 2))
+            canvas.coords(text, center, self._bottom + 2)
+        canvas.coords(self._axis, self._left, self._bottom, self._right, self._bottom)
+
+        self._place_bars(self._levels)
+        for i, value in enumerate(self._thresholds):
+            self._place_threshold_line(i, value)
+
+    def _level_y(self, level):
+        """Ordonnée canvas d'un niveau dans [0, 1]"""
+        return self._bottom - level * self._plot_height
 
-        self.ax.set_ylim(0, 1)
+    def _place_bars(self, levels):
+        coords = self.canvas.coords
+        bottom = self._bottom
+        level_y = self._level_y
+        for bar, (x0, x1), level in zip(self.bars, self._bar_x, levels):
+            coords(bar, x0, level_y(level), x1, bottom)
+
+    def _place_threshold_line(self, index, value):
+        y = self._level_y(min(max(value, 0.0), 1.0))
+        self.canvas.coords(self.threshold_lines[index], self._left, y, self._right, y)
 
     def setup_controls(self, parent):
         controls_frame = ttk.Frame(parent)
@@ -54,24 +108,45 @@ class SpectrumView(ttk.Frame):
 
         self.threshold_vars = {}
         self.auto_vars = {}  # NOUVEAU: Variables pour les checkboxes auto
+        self.band_labels = {}
+        self.sustained_labels = {}
+
+        # Références faibles : les callbacks stockés dans Tk ne gardent pas la vue en vie
+        view_ref = weakref.ref(self)
+        cm_ref = weakref.ref(self.callback_manager)
         
         def create_scale_callback(band_name):
             def callback(value):
+                view, cm = view_ref(), cm_ref()
+                if view is None or cm is None:
+                    return
                 try:
-                    float_value = float(value)
-                    rounded = round(float_value * 20) / 20
-                    self.threshold_vars[band_name].set(rounded)
-                    self.callback_manager.on_threshold_change(band_name, rounded)
+                    # Palier entier de 0.05 : le scale est toujours recalé sur la grille,
+                    # mais un drag dans le même palier ne notifie pas le processeur
+                    bucket = int(round(float(value) * 20))
+                    rounded = bucket / 20.0
+                    view.threshold_vars[band_name].set(rounded)
+                    view._threshold_shown[band_name] = rounded
+                    if view._last_bucket.get(band_name) == bucket:
+                        return
+                    view._last_bucket[band_name] = bucket
+                    cm.on_threshold_change(band_name, rounded)
                 except ValueError:
                     print(f"Invalid value: {value}")
             return callback
             
         def create_auto_callback(band_name):
             def callback():
-                auto_enabled = self.auto_vars[band_name].get()
-                self.callback_manager.on_auto_threshold_change(band_name, auto_enabled)
+                view, cm = view_ref(), cm_ref()
+                if view is None or cm is None:
+                    return
+                auto_enabled = view.auto_vars[band_name].get()
+                cm.on_auto_threshold_change(band_name, auto_enabled)
             return callback
 
+        # Un seul wrapper ttk.Style pour les styles de toutes les bandes
+        style = ttk.Style()
+
         for i, (band, color) in enumerate(zip(self.band_names, self.band_colors)):
             frame = ttk.Frame(controls_frame)
             frame.pack(side=tk.LEFT, fill=tk.Y, padx=5)
@@ -79,7 +154,6 @@ class SpectrumView(ttk.Frame):
             band_name = band.split('\n')[0]
             
             # Label avec indicateur d'état
-            self.band_labels = getattr(self, 'band_labels', {})
             label = ttk.Label(frame, text=band_name)
             label.pack(side=tk.TOP)
             self.band_labels[band_name] = label
@@ -97,7 +171,6 @@ class SpectrumView(ttk.Frame):
 
             # Style personnalisé pour chaque Scale
             style_name = f"Band{i}.Vertical.TScale"
-            style = ttk.Style()
             style.configure(style_name, troughcolor=color)
 
             # Scale vertical avec DoubleVar
@@ -117,61 +190,105 @@ class SpectrumView(ttk.Frame):
             scale.pack(side=tk.TOP, fill=tk.Y, expand=True)
             
             # NOUVEAU: Label pour afficher l'état sustained
-            self.sustained_labels = getattr(self, 'sustained_labels', {})
             sustained_label = ttk.Label(frame, text="", font=('Arial', 7))
             sustained_label.pack(side=tk.TOP)
             self.sustained_labels[band_name] = sustained_label
 
+    def destroy(self):
+        """Libère les variables, labels et items du canvas avant la destruction des widgets"""
+        self.bars = []
+        self.threshold_lines = []
+        self._band_texts = []
+        for mapping in (self.threshold_vars, self.auto_vars,
+                        self.band_labels, self.sustained_labels):
+            mapping.clear()
+        self._label_state.clear()
+        self._threshold_shown.clear()
+        self._last_bucket.clear()
+        super().destroy()
+
+    def _configure_label(self, label, **options):
+        """configure() du label seulement si les options diffèrent du dernier état écrit"""
+        state = tuple(options.items())
+        if self._label_state.get(label) != state:
+            self._label_state[label] = state
+            label.configure(**options)
+
+    @staticmethod
+    def _sustained_text(sustained_info):
+        """Texte et couleur du label pour un statut sustained"""
+        if sustained_info.get('sustained', False):
+            intensity = sustained_info.get('intensity', 0.0)
+            return f"SEQ {intensity:.1f}", 'green'
+        return "", 'black'
+
+    @staticmethod
+    def _fade_text(fade_info):
+        """Texte et couleur du label pour un statut de fade (None si rien à afficher)"""
+        if fade_info.get('in_fade', False):
+            intensity = fade_info.get('intensity', 0.0)
+            return f"FADE {intensity:.1f}", 'orange'
+        if fade_info.get('silence_duration', 0) > 1.0:
+            silence_time = fade_info.get('silence_duration', 0)
+            return f"QUIET {silence_time:.0f}s", 'gray'
+        return None
+
     def update_sustained_status(self, band, sustained_info):
         """Met à jour l'affichage du statut sustained"""
         if band in self.sustained_labels:
-            if sustained_info.get('sustained', False):
-                intensity = sustained_info.get('intensity', 0.0)
-                text = f"SEQ {intensity:.1f}"
-                color = 'green'
-            else:
-                text = ""
-                color = 'black'
-            
-            self.sustained_labels[band].configure(text=text, foreground=color)
+            text, color = self._sustained_text(sustained_info)
+            self._configure_label(self.sustained_labels[band], text=text, foreground=color)
     
     def update_fade_status(self, band, fade_info):
         """NOUVEAU: Met à jour l'affichage du statut de fade"""
         if band in self.sustained_labels:
-            if fade_info.get('in_fade', False):
-                intensity = fade_info.get('intensity', 0.0)
-                text = f"FADE {intensity:.1f}"
-                color = 'orange'
-                self.sustained_labels[band].configure(text=text, foreground=color)
-            elif fade_info.get('silence_duration', 0) > 1.0:
-                silence_time = fade_info.get('silence_duration', 0)
-                text = f"QUIET {silence_time:.0f}s"
-                color = 'gray'
-                self.sustained_labels[band].configure(text=text, foreground=color)
+            fade_text = self._fade_text(fade_info)
+            if fade_text is not None:
+                text, color = fade_text
+                self._configure_label(self.sustained_labels[band], text=text, foreground=color)
+
+    def update_band(self, band, sustained_info=None, fade_info=None,
+                    threshold_value=None, is_auto=None):
+        """Met à jour en une passe les indicateurs d'une bande (sustained, fade, seuil auto)"""
+        label = self.sustained_labels.get(band)
+        if label is not None:
+            # Le fade prend le pas sur le sustained : un seul configure du label
+            status = self._sustained_text(sustained_info) if sustained_info is not None else None
+            if fade_info is not None:
+                status = self._fade_text(fade_info) or status
+            if status is not None:
+                text, color = status
+                self._configure_label(label, text=text, foreground=color)
+
+        if is_auto is not None:
+            self.update_auto_threshold_display(band, threshold_value, is_auto)
 
     def update_auto_threshold_display(self, band, threshold_value, is_auto):
         """Met à jour l'affichage des seuils automatiques"""
         if is_auto and band in self.band_labels:
             # Mettre à jour la valeur du seuil si en mode auto
-            if band in self.threshold_vars:
+            if band in self.threshold_vars and self._threshold_shown.get(band) != threshold_value:
+                self._threshold_shown[band] = threshold_value
                 self.threshold_vars[band].set(threshold_value)
+                # Le scale a bougé sans passer par son callback : oublier le dernier palier
+                self._last_bucket.pop(band, None)
             
             # Changer l'apparence du label pour indiquer le mode auto
-            self.band_labels[band].configure(text=f"{band} (A)")
+            self._configure_label(self.band_labels[band], text=f"{band} (A)")
         elif band in self.band_labels:
-            self.band_labels[band].configure(text=band)
+            self._configure_label(self.band_labels[band], text=band)
 
     def update_bars(self, levels):
+        """levels : tableau float32 (une valeur par bande), borné à [0, 1] en une opération"""
         try:
-            for bar, level in zip(self.bars, levels):
-                bar.set_height(level)
-            self.canvas.draw_idle()
+            heights = np.clip(levels, 0.0, 1.0).tolist()
+            self._levels = heights
+            self._place_bars(heights)
         except Exception as e:
             print(f"Error updating bars: {e}")
 
     def update_threshold_line(self, band, value):
-        band_names = ['Bass', 'Low-Mid', 'High-Mid', 'Treble']
-        if band in band_names:
-            index = band_names.index(band)
-            self.threshold_lines[index].set_ydata([value, value])
-            self.canvas.draw_idle()
\ No newline at end of file
+        index = BAND_INDEX.get(band)
+        if index is not None:
+            self._thresholds[index] = value
+            self._place_threshold_line(index, value)
\ No newline at end of file